@@ -4,7 +4,6 @@ Analyzes actual imports and excludes unused modules.
 """
 import subprocess
 import sys
-import os
 import shutil
 from pathlib import Path
 
@@ -56,37 +55,134 @@ EXCLUDES = [
     'test',
     'doctest',
     'pdb',
+
+    # standalone debug entry, not part of the app
+    'evtmkr.cfg_window_debug',
+]
+
+# Qt payload collected by the PyQt6 hook as datas/binaries, which
+# --exclude-module cannot reach. Matched against lowercased dest paths.
+# Qt6Network and Qt6DBus stay: QtMultimedia / QtGui link against them.
+QT_DROP_PATTERNS = [
+    'qt6qml',
+    'qt6quick',
+    'qt6sql',
+    'qt6webengine',
+    'qt6pdf',
+    'qml/',
+    'sqldrivers/',
+]
+
+# Qt data/plugin dirs where only the listed file-name prefixes survive.
+# Prefixes are matched after stripping a leading 'lib', so libqxcb.so and
+# libqjpeg.dylib match like qwindows.dll does on Windows.
+QT_KEEP_ONLY = {
+    'translations/': ['qtbase_en'],
+    'platforms/': ['qwindows', 'qxcb', 'qcocoa'],
+    'imageformats/': ['qjpeg', 'qpng', 'qico'],
+}
+
+# large DLLs mapped on every launch; decompressing them costs more startup
+# time than the size they save
+UPX_EXCLUDE = [
+    'Qt6Core.dll',
+    'Qt6Gui.dll',
+    'Qt6Widgets.dll',
+    'python3.dll',
+    f'python{sys.version_info.major}{sys.version_info.minor}.dll',
 ]
 
+SPEC_FILE = PROJECT_ROOT / 'evtmkr.spec'
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# generated by build_pkg.py, do not edit
+
+QT_DROP_PATTERNS = {drop_patterns!r}
+QT_KEEP_ONLY = {keep_only!r}
+
+
+def _keep(entry):
+    dest = entry[0].replace('\\\\', '/').lower()
+    if any(p in dest for p in QT_DROP_PATTERNS):
+        return False
+    for folder, allowed in QT_KEEP_ONLY.items():
+        if folder in dest:
+            name = dest.rsplit('/', 1)[-1].removeprefix('lib')
+            return any(name.startswith(a) for a in allowed)
+    return True
+
+
+a = Analysis(
+    ['src/evtmkr/__main__.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('src/evtmkr/evt-config.yaml', 'evtmkr')],
+    hiddenimports=[],
+    excludes={excludes!r},
+    noarchive=False,
+    optimize=2,
+)
+a.binaries = [b for b in a.binaries if _keep(b)]
+a.datas = [d for d in a.datas if _keep(d)]
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='evtmkr',
+    debug=False,
+    strip=True,
+    upx=True,
+    upx_exclude={upx_exclude!r},
+    console=False,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=True,
+    upx=True,
+    upx_exclude={upx_exclude!r},
+    name='evtmkr',
+)
+"""
+
 def clean_build():
     """Remove old build artifacts."""
     if DIST_DIR.exists():
         shutil.rmtree(DIST_DIR)
     if BUILD_DIR.exists():
         shutil.rmtree(BUILD_DIR)
-    spec_file = PROJECT_ROOT / 'evtmkr.spec'
-    if spec_file.exists():
-        spec_file.unlink()
+    if SPEC_FILE.exists():
+        SPEC_FILE.unlink()
     print("Cleaned build directories")
 
+def write_spec():
+    """Write the spec file; lets us filter Analysis datas/binaries."""
+    SPEC_FILE.write_text(
+        SPEC_TEMPLATE.format(
+            drop_patterns=QT_DROP_PATTERNS,
+            keep_only=QT_KEEP_ONLY,
+            excludes=EXCLUDES,
+            upx_exclude=UPX_EXCLUDE,
+        ),
+        encoding='utf-8',
+    )
+    print(f"Wrote {SPEC_FILE.name}")
+
 def build_package():
     """Build the package with PyInstaller."""
-    exclude_opts = []
-    for module in EXCLUDES:
-        exclude_opts.extend(['--exclude-module', module])
-    
+    write_spec()
+
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--name', 'evtmkr',
-        '--onedir',
-        '--windowed',
         '--clean',
         '--noconfirm',
         '--upx-dir', r'D:\Users\zix63\GitHub\event-marker\upx-5.0.2-win64',
-        '--strip',
-        *exclude_opts,
-        '--add-data', f'src/evtmkr/evt-config.yaml{os.pathsep}evtmkr',
-        'src/evtmkr/__main__.py'
+        str(SPEC_FILE),
     ]
     
     print("Building package...")
@@ -1,14 +1,26 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-
-from evtmkr.gui import VideoPlayer
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QSplashScreen
 
 def main():
     """Main entry point for the event-marker application."""
     app = QApplication(sys.argv)
+
+    # show something while the heavy gui imports (multimedia, matplotlib, pandas) run
+    pixmap = QPixmap(320, 80)
+    pixmap.fill(app.palette().window().color())
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Loading event-marker...", Qt.AlignmentFlag.AlignCenter)
+    splash.show()
+    app.processEvents()
+
+    from evtmkr.gui import VideoPlayer
+
     player = VideoPlayer(app=app)
     player.show()
+    splash.finish(player)
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -100,7 +100,9 @@ class Config(metaclass=ConfigMeta):
             },
             'workspace': {
                 'default_path': r'P:\projects\monkeys\Chronic_VLL\DATA\Pici',
-                'auto_search_events': True
+                'auto_search_events': True,
+                'task_animals': ['Pici', 'Fusillo'],
+                'task_types': ['TS', 'BBT', 'Brinkman', 'Pull']
             }
         }
         self._process_config()
@@ -210,6 +212,14 @@ class Config(metaclass=ConfigMeta):
     def AUTO_SEARCH_EVENTS(self) -> bool:
         return self._data.get('workspace', {}).get('auto_search_events', True)
     
+    @property
+    def TASK_ANIMALS(self) -> list:
+        return self._data.get('workspace', {}).get('task_animals', ['Pici', 'Fusillo'])
+    
+    @property
+    def TASK_TYPES(self) -> list:
+        return self._data.get('workspace', {}).get('task_types', ['TS', 'BBT', 'Brinkman', 'Pull'])
+    
     def get_frame_compensation(self, fps: float) -> int:
         """get compensation value for given fps"""
         comp_dict = self._cache.get('frame_compensation', {})
@@ -1,13 +1,9 @@
-import yaml
-import re
-from functools import partial
 import logging
-from copy import deepcopy
 
 lg = logging.getLogger(__name__)
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import QStringListModel
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QTabWidget,
     QLineEdit, QPushButton, QCheckBox, QSpinBox, QDoubleSpinBox,
@@ -15,18 +11,65 @@ from PyQt6.QtWidgets import (
     QComboBox, QFrame, QScrollArea
 )
 
-from evtmkr.cfg import config
+def _config():
+    """Returns the global config, importing it (and parsing yaml) on first use."""
+    from evtmkr.cfg import config
+    return config
+
+# curated Qt key names offered in marker dropdowns: F1-F12, 0-9, A-Z
+_QT_KEY_CHOICES = tuple(
+    [f"Key_F{i}" for i in range(1, 13)]
+    + [f"Key_{i}" for i in range(10)]
+    + [f"Key_{chr(c)}" for c in range(ord('A'), ord('Z') + 1)]
+)
+
+def _fast_clone(obj):
+    """Copies the plain dict/list tree loaded from yaml, cheaper than deepcopy."""
+    if isinstance(obj, dict):
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_fast_clone(v) for v in obj]
+    return obj
+
+def _set_combo_text_silently(combo, text):
+    """Sets a combo's text without emitting currentTextChanged."""
+    combo.blockSignals(True)
+    try:
+        combo.setCurrentText(text)
+    finally:
+        combo.blockSignals(False)
 
 class ConfigWindow(QDialog):
     """A dialog window for editing application settings."""
 
+    # simple form tabs: (attribute, widget class, row label or None, options)
+    _TAB_SPECS = {
+        "UI": [
+            ("ui_window_title", QLineEdit, "Window Title:", {"enabled": False}),
+            ("ui_marker_float_enabled", QCheckBox, None, {"text": "Show floating marker window"}),
+            ("ui_csv_plot_enabled", QCheckBox, None, {"text": "Show CSV plot window on startup"}),
+        ],
+        "Playback": [
+            ("pb_fps", QDoubleSpinBox, "Playback FPS:", {"range": (1, 1000)}),
+            ("pb_video_fps_original", QDoubleSpinBox, "Original Video FPS:", {"range": (1, 1000)}),
+            ("pb_large_step_multiplier", QSpinBox, "Large Frame Step Multiplier:", {"range": (1, 1000)}),
+            ("pb_frame_step", QSpinBox, "Frame Step:", {"range": (1, 10)}),
+        ],
+        "Workspace": [
+            ("ws_auto_search", QCheckBox, None, {"text": "Automatically search for event files on video load"}),
+        ],
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Edit Configuration")
         self.setMinimumSize(550, 450)
 
-        # create a deep copy of config data to work with
-        self._config_copy = deepcopy(config._data)
+        # create a copy of config data to work with
+        self._config_copy = _fast_clone(_config()._data)
+
+        # one read-only key list shared by every marker key dropdown
+        self._key_model = QStringListModel(list(_QT_KEY_CHOICES), self)
 
         # main layout
         layout = QVBoxLayout(self)
@@ -36,8 +79,8 @@ class ConfigWindow(QDialog):
         layout.addWidget(self.tabs)
 
         # create tabs
-        self.create_ui_tab()
-        self.create_playback_tab()
+        self.create_form_tab("UI")
+        self.create_form_tab("Playback")
         self.create_marker_tab()
         self.create_workspace_tab()
 
@@ -52,42 +95,26 @@ class ConfigWindow(QDialog):
 
         self.load_settings()
 
-    def create_ui_tab(self):
-        """Creates the 'UI' settings tab."""
+    def create_form_tab(self, title):
+        """Creates a form tab from _TAB_SPECS and returns its layout."""
         tab = QWidget()
         layout = QFormLayout(tab)
-        
-        self.ui_window_title = QLineEdit()
-        self.ui_window_title.setEnabled(False)
-        self.ui_marker_float_enabled = QCheckBox("Show floating marker window")
-        self.ui_csv_plot_enabled = QCheckBox("Show CSV plot window on startup")
-        
-        layout.addRow("Window Title:", self.ui_window_title)
-        layout.addRow(self.ui_marker_float_enabled)
-        layout.addRow(self.ui_csv_plot_enabled)
-        
-        self.tabs.addTab(tab, "UI")
 
-    def create_playback_tab(self):
-        """Creates the 'Playback' settings tab."""
-        tab = QWidget()
-        layout = QFormLayout(tab)
+        for attr, widget_cls, label, opts in self._TAB_SPECS[title]:
+            widget = widget_cls(opts["text"]) if "text" in opts else widget_cls()
+            if "range" in opts:
+                widget.setRange(*opts["range"])
+            if "enabled" in opts:
+                widget.setEnabled(opts["enabled"])
+            setattr(self, attr, widget)
 
-        self.pb_fps = QDoubleSpinBox()
-        self.pb_fps.setRange(1, 1000)
-        self.pb_video_fps_original = QDoubleSpinBox()
-        self.pb_video_fps_original.setRange(1, 1000)
-        self.pb_large_step_multiplier = QSpinBox()
-        self.pb_large_step_multiplier.setRange(1, 1000)
-        self.pb_frame_step = QSpinBox()
-        self.pb_frame_step.setRange(1, 10)
-        
-        layout.addRow("Playback FPS:", self.pb_fps)
-        layout.addRow("Original Video FPS:", self.pb_video_fps_original)
-        layout.addRow("Large Frame Step Multiplier:", self.pb_large_step_multiplier)
-        layout.addRow("Frame Step:", self.pb_frame_step)
-        
-        self.tabs.addTab(tab, "Playback")
+            if label:
+                layout.addRow(label, widget)
+            else:
+                layout.addRow(widget)
+
+        self.tabs.addTab(tab, title)
+        return layout
 
     def create_marker_tab(self):
         """Creates the 'Markers' settings tab with dynamic rows and a scroll area."""
@@ -121,9 +148,15 @@ class ConfigWindow(QDialog):
 
         # --- pairing settings area ---
         self.pairing_widget = QWidget()
-        self.pairing_layout = QFormLayout(self.pairing_widget)
+        self.pairing_layout = QVBoxLayout(self.pairing_widget)
         self.marker_pairing_enabled = QCheckBox("Enable marker pairing")
-        self.pairing_layout.addRow(self.marker_pairing_enabled)
+        self.pairing_layout.addWidget(self.marker_pairing_enabled)
+        # pairing dropdowns live in their own container, swapped out on refresh
+        self._pairing_rows_container = QWidget()
+        self._pairing_rows_layout = QFormLayout(self._pairing_rows_container)
+        self._pairing_rows_layout.setContentsMargins(0, 0, 0, 0)
+        self.pairing_layout.addWidget(self._pairing_rows_container)
+        self._pairing_combos = []
         scroll_layout.addWidget(self.pairing_widget)
 
         scroll_layout.addStretch()
@@ -139,7 +172,8 @@ class ConfigWindow(QDialog):
         key_combo = QComboBox()
         self.populate_key_combo(key_combo)
         if key_name:
-            key_combo.setCurrentText(key_name)
+            _set_combo_text_silently(key_combo, key_name)
+        # connect only after the initial text is set, so it doesn't trigger a refresh
         key_combo.currentTextChanged.connect(self.refresh_marker_ui)
 
         # color picker button
@@ -158,18 +192,24 @@ class ConfigWindow(QDialog):
         row_layout.addWidget(key_combo)
         row_layout.addWidget(color_btn)
         row_layout.addWidget(remove_btn)
+
+        # keep direct references, avoids findChild() walks later
+        row_widget._key_combo = key_combo
+        row_widget._color_btn = color_btn
         
         # add the new row to the form layout
-        self.marker_rows_layout.addRow(f"Marker:", row_widget)
+        label = QLabel("Marker:")
+        self.marker_rows_layout.addRow(label, row_widget)
+        row_widget._label = label
         
         if update_ui:
             self.refresh_marker_ui()
 
-    def remove_marker_row(self, row_widget):
+    def remove_marker_row(self, row_widget, refresh=True):
         """Removes a marker row from the layout."""
         # disconnect the combo’s signal (if still connected)
         try:
-            row_widget.findChild(QComboBox).currentTextChanged.disconnect(self.refresh_marker_ui)
+            row_widget._key_combo.currentTextChanged.disconnect(self.refresh_marker_ui)
         except (TypeError, RuntimeError):
             pass
 
@@ -182,25 +222,12 @@ class ConfigWindow(QDialog):
         except RuntimeError:
             pass
 
-        self.refresh_marker_ui()
+        if refresh:
+            self.refresh_marker_ui()
 
     def populate_key_combo(self, combo):
-        """Fills a QComboBox with a curated list of Qt keys."""
-        if combo.count() > 0: return # already populated
-        
-        keys = []
-        # function keys
-        for i in range(1, 13):
-            keys.append(f"F{i}")
-        # number keys (main keyboard)
-        for i in range(10):
-            keys.append(str(i))
-        # letter keys
-        for i in range(ord('A'), ord('Z') + 1):
-            keys.append(chr(i))
-        
-        qt_keys = [f"Key_{k}" for k in keys]
-        combo.addItems(qt_keys)
+        """Points a QComboBox at the shared list of curated Qt keys."""
+        combo.setModel(self._key_model)
 
     def get_marker_row_widgets(self):
         """Helper to get a list of all marker row widgets."""
@@ -211,23 +238,24 @@ class ConfigWindow(QDialog):
         """Rebuilds all marker-related UI elements to be in sync."""
         # get current state
         row_widgets = self.get_marker_row_widgets()
-        key_names = [row.findChild(QComboBox).currentText() for row in row_widgets]
+        key_names = [row._key_combo.currentText() for row in row_widgets]
         
-        # remember current pairing selections
-        old_pairing_selections = {}
-        pairing_combos = self.pairing_widget.findChildren(QComboBox)
-        for i, combo in enumerate(pairing_combos):
-            old_pairing_selections[i] = combo.currentText()
+        # remember current pairing selections, in build order
+        old_pairing_selections = [combo.currentText() for combo in self._pairing_combos]
 
         # relabel marker definition rows
         for i, row_widget in enumerate(row_widgets):
-            label = self.marker_rows_layout.labelForField(row_widget)
-            if label:
-                label.setText(f"'{key_names[i]}':")
+            row_widget._label.setText(f"'{key_names[i]}':")
         
-        # clear old pairing widgets, but keep the checkbox
-        while self.pairing_layout.rowCount() > 1:
-            self.pairing_layout.removeRow(1)
+        # replace old pairing widgets in one go, the checkbox stays
+        old_container = self._pairing_rows_container
+        self._pairing_rows_container = QWidget()
+        self._pairing_rows_layout = QFormLayout(self._pairing_rows_container)
+        self._pairing_rows_layout.setContentsMargins(0, 0, 0, 0)
+        self.pairing_layout.replaceWidget(old_container, self._pairing_rows_container)
+        old_container.hide()
+        old_container.deleteLater()
+        self._pairing_combos = []
 
         if not key_names: return
 
@@ -237,17 +265,14 @@ class ConfigWindow(QDialog):
             options = ["None"] + [k for k in key_names if k != key_name]
             combo.addItems(options)
             # restore old selection if possible
-            if i in old_pairing_selections and old_pairing_selections[i] in options:
-                combo.setCurrentText(old_pairing_selections[i])
-            self.pairing_layout.addRow(f"Pair '{key_name}' with:", combo)
+            if i < len(old_pairing_selections) and old_pairing_selections[i] in options:
+                _set_combo_text_silently(combo, old_pairing_selections[i])
+            self._pairing_rows_layout.addRow(f"Pair '{key_name}' with:", combo)
+            self._pairing_combos.append(combo)
 
     def create_workspace_tab(self):
         """Creates the 'Workspace' settings tab."""
-        tab = QWidget()
-        layout = QFormLayout(tab)
-
-        self.ws_auto_search = QCheckBox("Automatically search for event files on video load")
-        layout.addRow(self.ws_auto_search)
+        layout = self.create_form_tab("Workspace")
 
         # default path editor
         path_layout = QHBoxLayout()
@@ -258,55 +283,58 @@ class ConfigWindow(QDialog):
         path_layout.addWidget(browse_btn)
 
         layout.addRow("Default Work Path:", path_layout)
-        self.tabs.addTab(tab, "Workspace")
 
     def load_settings(self):
         """Populates the widgets with current values from the config copy."""
-        # clear existing dynamic rows first
-        while self.marker_rows_layout.rowCount() > 0:
-            self.remove_marker_row(self.get_marker_row_widgets()[0])
-
-        # ui
-        self.ui_window_title.setText(self._config_copy.get('ui', {}).get('window_title', ''))
-        self.ui_marker_float_enabled.setChecked(self._config_copy.get('ui', {}).get('marker_float_enabled', False))
-        self.ui_csv_plot_enabled.setChecked(self._config_copy.get('ui', {}).get('csv_plot_enabled', False))
-
-        # playback
-        self.pb_fps.setValue(self._config_copy.get('playback', {}).get('fps', 30.0))
-        self.pb_video_fps_original.setValue(self._config_copy.get('playback', {}).get('video_fps_original', 119.88))
-        self.pb_large_step_multiplier.setValue(self._config_copy.get('playback', {}).get('large_step_multiplier', 6))
-        self.pb_frame_step.setValue(self._config_copy.get('playback', {}).get('frame_step', 1))
-
-        # markers
-        keys = self._config_copy.get('marker', {}).get('keys', [])
-        colors_raw = self._config_copy.get('marker', {}).get('colors', [])
-        colors = [QColor(*rgb) for rgb in colors_raw]
-        for i, key_name in enumerate(keys):
-            color = colors[i] if i < len(colors) else None
-            self.add_marker_row(key_name, color, update_ui=False) # add rows without updating UI each time
+        # freeze repaints while the rows are rebuilt
+        self.setUpdatesEnabled(False)
+        try:
+            # clear existing dynamic rows first, refresh once after re-adding
+            for row_widget in self.get_marker_row_widgets():
+                self.remove_marker_row(row_widget, refresh=False)
+
+            # ui
+            self.ui_window_title.setText(self._config_copy.get('ui', {}).get('window_title', ''))
+            self.ui_marker_float_enabled.setChecked(self._config_copy.get('ui', {}).get('marker_float_enabled', False))
+            self.ui_csv_plot_enabled.setChecked(self._config_copy.get('ui', {}).get('csv_plot_enabled', False))
+
+            # playback
+            self.pb_fps.setValue(self._config_copy.get('playback', {}).get('fps', 30.0))
+            self.pb_video_fps_original.setValue(self._config_copy.get('playback', {}).get('video_fps_original', 119.88))
+            self.pb_large_step_multiplier.setValue(self._config_copy.get('playback', {}).get('large_step_multiplier', 6))
+            self.pb_frame_step.setValue(self._config_copy.get('playback', {}).get('frame_step', 1))
+
+            # markers
+            keys = self._config_copy.get('marker', {}).get('keys', [])
+            colors_raw = self._config_copy.get('marker', {}).get('colors', [])
+            colors = [QColor(*rgb) for rgb in colors_raw]
+            for i, key_name in enumerate(keys):
+                color = colors[i] if i < len(colors) else None
+                self.add_marker_row(key_name, color, update_ui=False) # add rows without updating UI each time
         
-        self.refresh_marker_ui() # update all labels and pairing options once
+            self.refresh_marker_ui() # update all labels and pairing options once
 
-        # pairing
-        self.marker_pairing_enabled.setChecked(self._config_copy.get('marker', {}).get('pairing', {}).get('enabled', False))
-        rules = self._config_copy.get('marker', {}).get('pairing', {}).get('rules', {})
+            # pairing
+            self.marker_pairing_enabled.setChecked(self._config_copy.get('marker', {}).get('pairing', {}).get('enabled', False))
+            rules = self._config_copy.get('marker', {}).get('pairing', {}).get('rules', {})
         
-        # translate index-based rules from config to key-based UI
-        key_names = [row.findChild(QComboBox).currentText() for row in self.get_marker_row_widgets()]
-        index_to_key = {str(i + 1): key for i, key in enumerate(key_names)}
-        pairing_combos = self.pairing_widget.findChildren(QComboBox)
-
-        for i, combo in enumerate(pairing_combos):
-            current_marker_index_str = str(i + 1)
-            paired_marker_index_str = rules.get(current_marker_index_str)
-            if paired_marker_index_str:
-                paired_key_name = index_to_key.get(paired_marker_index_str)
-                if paired_key_name:
-                    combo.setCurrentText(paired_key_name)
-
-        # workspace
-        self.ws_auto_search.setChecked(self._config_copy.get('workspace', {}).get('auto_search_events', False))
-        self.ws_default_path.setText(self._config_copy.get('workspace', {}).get('default_path', ''))
+            # translate index-based rules from config to key-based UI
+            # (rows were just built from `keys`, in the same order)
+            index_to_key = {str(i + 1): key for i, key in enumerate(keys)}
+
+            for i, combo in enumerate(self._pairing_combos):
+                current_marker_index_str = str(i + 1)
+                paired_marker_index_str = rules.get(current_marker_index_str)
+                if paired_marker_index_str:
+                    paired_key_name = index_to_key.get(paired_marker_index_str)
+                    if paired_key_name:
+                        _set_combo_text_silently(combo, paired_key_name)
+
+            # workspace
+            self.ws_auto_search.setChecked(self._config_copy.get('workspace', {}).get('auto_search_events', False))
+            self.ws_default_path.setText(self._config_copy.get('workspace', {}).get('default_path', ''))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def apply_changes(self):
         """Reads values from widgets, updates the actual config object, and saves."""
@@ -326,11 +354,10 @@ class ConfigWindow(QDialog):
 
             # markers - keys and colors
             row_widgets = self.get_marker_row_widgets()
-            keys = [row.findChild(QComboBox).currentText() for row in row_widgets]
-            colors = []
+            keys, colors = [], []
             for row in row_widgets:
-                color_btn = row.findChild(QPushButton)
-                color = color_btn.palette().color(QPalette.ColorRole.Button)
+                color = row._color_btn._color
+                keys.append(row._key_combo.currentText())
                 colors.append([color.red(), color.green(), color.blue()])
             
             self._config_copy.setdefault('marker', {})['keys'] = keys
@@ -339,16 +366,13 @@ class ConfigWindow(QDialog):
             # markers - pairing (translate key-based UI to index-based config)
             self._config_copy['marker'].setdefault('pairing', {})['enabled'] = self.marker_pairing_enabled.isChecked()
             key_to_index = {key: str(i + 1) for i, key in enumerate(keys)}
-            new_rules = {}
-            pairing_combos = self.pairing_widget.findChildren(QComboBox)
-
-            for i, combo in enumerate(pairing_combos):
-                selected_key = combo.currentText()
-                if selected_key != "None":
-                    current_marker_index_str = str(i + 1)
-                    paired_marker_index_str = key_to_index.get(selected_key)
-                    if paired_marker_index_str:
-                        new_rules[current_marker_index_str] = paired_marker_index_str
+            selections = [combo.currentText() for combo in self._pairing_combos]
+            # "None" is never a marker key, so unpaired rows drop out here
+            new_rules = {
+                str(i + 1): key_to_index[selected_key]
+                for i, selected_key in enumerate(selections)
+                if selected_key in key_to_index
+            }
             self._config_copy['marker']['pairing']['rules'] = new_rules
 
             # workspace
@@ -356,7 +380,8 @@ class ConfigWindow(QDialog):
             self._config_copy['workspace']['default_path'] = self.ws_default_path.text()
 
             # now apply the copy to the actual config
-            config._data = deepcopy(self._config_copy)
+            config = _config()
+            config._data = _fast_clone(self._config_copy)
             config.save()
             config.reload()
             
@@ -370,7 +395,7 @@ class ConfigWindow(QDialog):
     def save_changes(self):
         """Applies changes and saves them to the config file."""
         if self.apply_changes():
-            config.save()
+            _config().save()
             self.accept() # close dialog with 'ok' status
 
     def handle_button_click(self, button):
@@ -386,16 +411,14 @@ class ConfigWindow(QDialog):
 
     def change_marker_color(self, button):
         """Opens a color dialog to change a marker's color."""
-        initial_color = button.palette().color(QPalette.ColorRole.Button)
+        initial_color = button._color
         color = QColorDialog.getColor(initial_color, self, "Select Marker Color")
         if color.isValid():
             self.set_button_color(button, color)
 
     def set_button_color(self, button, color):
         """Sets the background color of a button."""
-        palette = button.palette()
-        palette.setColor(QPalette.ColorRole.Button, color)
-        button.setPalette(palette)
+        button._color = color
         # set text color based on luminance for readability
         text_color = "black" if color.lightness() > 127 else "white"
         button.setStyleSheet(f"background-color: {color.name()}; color: {text_color};")
@@ -409,74 +432,3 @@ class ConfigWindow(QDialog):
         if directory:
             self.ws_default_path.setText(directory)
 
-
-if __name__ == "__main__":
-    """
-    Standalone mode for debugging the config window.
-    Run with: python src/cfg_window.py
-    
-    This allows testing the config UI without launching the main app.
-    Changes are written to the actual evt-config.yaml file.
-    """
-    import sys
-    from pathlib import Path
-    from PyQt6.QtWidgets import QApplication
-
-    lg.setLevel(logging.DEBUG)
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    ch.setFormatter(formatter)
-    lg.addHandler(ch)
-    
-    print("="*60)
-    print("Event Marker - Standalone Configuration Editor")
-    print("="*60)
-    print(f"\nLoaded config from: {config._config_file}")
-    print(f"Config location: {Path(config._config_file).absolute()}")
-    print("\nCurrent settings:")
-    print(f"  Markers: {len(config.MARKER_KEYS)} configured")
-    print(f"  Window Title: {config.WINDOW_TITLE}")
-    print(f"  Marker Float: {config.MARKER_FLOAT_ENABLED}")
-    print(f"  CSV Plot: {config.CSV_PLOT_ENABLED}")
-    print(f"  Playback FPS: {config.PLAYBACK_FPS}")
-    print(f"  Video FPS: {config.VIDEO_FPS_ORIGINAL}")
-    print("="*60 + "\n")
-    
-    app = QApplication(sys.argv)
-    
-    # Create config window
-    window = ConfigWindow()
-    window.setWindowTitle("Event Marker - Configuration (Debug Mode)")
-    
-    # Show as non-modal window
-    window.setWindowModality(Qt.WindowModality.NonModal)
-    window.show()
-    
-    # Run event loop
-    result = app.exec()
-    
-    # Print results
-    print("\n" + "="*60)
-
-    if window.result() == QDialog.DialogCode.Accepted:
-        print("✓ Configuration SAVED to evt-config.yaml")
-        print("="*60)
-        print("\nUpdated settings:")
-        print(f"  Markers: {len(config.MARKER_KEYS)} configured")
-        print(f"  Marker Keys: {config.MARKER_KEYS}")
-        print(f"  Window Title: {config.WINDOW_TITLE}")
-        print(f"  Marker Float: {config.MARKER_FLOAT_ENABLED}")
-        print(f"  CSV Plot: {config.CSV_PLOT_ENABLED}")
-        print(f"  Playback FPS: {config.PLAYBACK_FPS}")
-        print(f"  Video FPS: {config.VIDEO_FPS_ORIGINAL}")
-        print(f"  Large Step: {config.LARGE_STEP_MULTIPLIER}")
-        print(f"  Frame Step: {config.FRAME_STEP}")
-        print(f"  Auto Search: {config.AUTO_SEARCH_EVENTS}")
-        print(f"  Default Path: {config.DEFAULT_WORK_PATH}")
-        print(f"\n  Config file: {Path(config._config_file).absolute()}")
-    else:
-        print("Configuration CANCELLED - No changes saved")
-    print("="*60 + "\n")
-    
-    sys.exit(result)
\ No newline at end of file
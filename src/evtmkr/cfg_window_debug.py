@@ -0,0 +1,80 @@
+"""
+Standalone mode for debugging the config window.
+Run with: python -m evtmkr.cfg_window_debug
+
+This allows testing the config UI without launching the main app.
+Changes are written to the actual evt-config.yaml file.
+Kept out of cfg_window so the packaged app doesn't carry it.
+"""
+import sys
+import logging
+from pathlib import Path
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QDialog
+
+from evtmkr.cfg_window import ConfigWindow, _config, lg
+
+def main():
+    config = _config()
+    lg.setLevel(logging.DEBUG)
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    ch.setFormatter(formatter)
+    lg.addHandler(ch)
+
+    print("="*60)
+    print("Event Marker - Standalone Configuration Editor")
+    print("="*60)
+    print(f"\nLoaded config from: {config._config_file}")
+    print(f"Config location: {Path(config._config_file).absolute()}")
+    print("\nCurrent settings:")
+    print(f"  Markers: {len(config.MARKER_KEYS)} configured")
+    print(f"  Window Title: {config.WINDOW_TITLE}")
+    print(f"  Marker Float: {config.MARKER_FLOAT_ENABLED}")
+    print(f"  CSV Plot: {config.CSV_PLOT_ENABLED}")
+    print(f"  Playback FPS: {config.PLAYBACK_FPS}")
+    print(f"  Video FPS: {config.VIDEO_FPS_ORIGINAL}")
+    print("="*60 + "\n")
+
+    app = QApplication(sys.argv)
+
+    # Create config window
+    window = ConfigWindow()
+    window.setWindowTitle("Event Marker - Configuration (Debug Mode)")
+
+    # Show as non-modal window
+    window.setWindowModality(Qt.WindowModality.NonModal)
+    window.show()
+
+    # Run event loop
+    result = app.exec()
+
+    # Print results
+    print("\n" + "="*60)
+
+    if window.result() == QDialog.DialogCode.Accepted:
+        print("✓ Configuration SAVED to evt-config.yaml")
+        print("="*60)
+        print("\nUpdated settings:")
+        print(f"  Markers: {len(config.MARKER_KEYS)} configured")
+        print(f"  Marker Keys: {config.MARKER_KEYS}")
+        print(f"  Window Title: {config.WINDOW_TITLE}")
+        print(f"  Marker Float: {config.MARKER_FLOAT_ENABLED}")
+        print(f"  CSV Plot: {config.CSV_PLOT_ENABLED}")
+        print(f"  Playback FPS: {config.PLAYBACK_FPS}")
+        print(f"  Video FPS: {config.VIDEO_FPS_ORIGINAL}")
+        print(f"  Large Step: {config.LARGE_STEP_MULTIPLIER}")
+        print(f"  Frame Step: {config.FRAME_STEP}")
+        print(f"  Auto Search: {config.AUTO_SEARCH_EVENTS}")
+        print(f"  Default Path: {config.DEFAULT_WORK_PATH}")
+        print(f"\n  Config file: {Path(config._config_file).absolute()}")
+    else:
+        print("Configuration CANCELLED - No changes saved")
+    print("="*60 + "\n")
+
+    sys.exit(result)
+
+if __name__ == "__main__":
+    main()
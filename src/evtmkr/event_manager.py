@@ -6,28 +6,77 @@ class EventManager:
         self.markers = defaultdict(list)
         self.undo_stack = []
         self.redo_stack = []
+        self.revision = 0  # bumped on every change, lets views cache derived data
+        # per-type frame sets for O(1) membership, rebuilt lazily when stale
+        self._marker_sets: dict[str, set[int]] = {}
+        self._sets_rev = 0
+
+    def _frame_set(self, key):
+        if self._sets_rev != self.revision:
+            self._marker_sets = {k: set(v) for k, v in self.markers.items()}
+            self._sets_rev = self.revision
+        return self._marker_sets.setdefault(key, set())
+
+    def marker_type_at(self, frame):
+        """First marker type with a marker at frame, or None."""
+        for mtype in self.markers:
+            if frame in self._frame_set(mtype):
+                return mtype
+        return None
 
     def add_marker(self, event_type, frame):
         key = str(event_type)
-        if frame not in self.markers[key]:
+        frames = self._frame_set(key)
+        if frame not in frames:
+            frames.add(frame)
             self.markers[key].append(frame)
             self.markers[key].sort()
             self.undo_stack.append(('add', key, frame))
             self.redo_stack.clear()
+            self.revision += 1
+            self._sets_rev = self.revision  # updated in place above
             print(f"Marked event {key} at frame {frame}")
             return True
         return False
 
     def remove_marker_at_frame(self, frame):
-        for mtype, frames in self.markers.items():
-            if frame in frames:
-                frames.remove(frame)
-                self.undo_stack.append(('remove', mtype, frame))
-                self.redo_stack.clear()
-                print(f"Deleted marker {mtype} @ frame {frame}")
-                return True
+        mtype = self.marker_type_at(frame)
+        if mtype is not None:
+            self.markers[mtype].remove(frame)
+            self._marker_sets[mtype].discard(frame)
+            self.undo_stack.append(('remove', mtype, frame))
+            self.redo_stack.clear()
+            self.revision += 1
+            self._sets_rev = self.revision  # updated in place above
+            print(f"Deleted marker {mtype} @ frame {frame}")
+            return True
         return False
 
+    def move_marker(self, key, old_frame, new_frame):
+        """Moves one marker of type key; history entries pointing at it follow."""
+        frames = self.markers[key]
+        frames[frames.index(old_frame)] = new_frame
+        frames.sort()
+
+        # update all matching entries in undo stack
+        for uidx, action_tuple in enumerate(self.undo_stack):
+            if len(action_tuple) == 3:  # add/remove actions
+                action, etype, uframe = action_tuple
+                if etype == key and uframe == old_frame:
+                    self.undo_stack[uidx] = (action, etype, new_frame)
+            elif len(action_tuple) == 4:  # move actions
+                action, etype, prev_frame, uframe = action_tuple
+                if etype == key and uframe == old_frame:
+                    self.undo_stack[uidx] = (action, etype, prev_frame, new_frame)
+
+        # add new move action
+        self.undo_stack.append(('move', key, old_frame, new_frame))
+        self.redo_stack.clear()
+        self.revision += 1
+
+        print(f"Nudged marker {key} from {old_frame} to {new_frame}")
+        return True
+
     def undo(self):
         if not self.undo_stack:
             return
@@ -51,6 +100,7 @@ class EventManager:
             self.markers[key].sort()
             self.redo_stack.append(action_tuple)
         
+        self.revision += 1
         print(f"Undid {action} for event {action_tuple[1]}")
 
     def redo(self):
@@ -76,12 +126,20 @@ class EventManager:
             self.markers[key].sort()
             self.undo_stack.append(action_tuple)
 
+        self.revision += 1
         print(f"Redid {action} for event {action_tuple[1]}")
 
     def get_all_marker_frames(self):
         return sorted([frame for frames in self.markers.values() for frame in frames])
 
+    def load(self, markers):
+        """Replaces all markers, e.g. from an event file; history is dropped."""
+        self.clear()
+        self.markers.update({str(k): sorted(v) for k, v in markers.items()})
+        self.revision += 1
+
     def clear(self):
         self.markers.clear()
         self.undo_stack.clear()
-        self.redo_stack.clear()
\ No newline at end of file
+        self.redo_stack.clear()
+        self.revision += 1
\ No newline at end of file
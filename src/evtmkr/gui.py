@@ -30,16 +30,17 @@ import sys
 import os
 import re
 import ast
-import glob
-import platform
-import subprocess
+import json
+import hashlib
 import logging
-from bisect import bisect_right
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
 
 from PyQt6.QtCore import (
-    Qt, QUrl, QTime, QTimer, QEvent, QRectF, QPointF,
-    QSettings, QSize, QPoint, pyqtSignal
+    Qt, QUrl, QTimer, QElapsedTimer, QEvent, QRectF, QPointF,
+    QSettings, QSize, QPoint, QSignalBlocker, pyqtSignal
 )
 from PyQt6.QtGui import QAction, QKeyEvent, QPainter, QColor, QTransform, QFont, QGuiApplication
 from PyQt6.QtWidgets import (
@@ -55,15 +56,64 @@ from evtmkr.key_handler import KeyHandler
 from evtmkr.cfg import config
 from evtmkr.playback_controller import PlaybackController
 from evtmkr.csv_window import CSVPlotWindow
-from evtmkr.csv_analysis_window import CSVAnalysisWindow
 from evtmkr.qivideo_widget import QIVideoWidget
 from evtmkr.markers_widget import MarkersWidget
-from evtmkr.cfg_window import ConfigWindow
 from evtmkr.ol_logging import set_colored_logger
 
 lg = set_colored_logger(__name__)
 lg.setLevel(logging.DEBUG)
 
+# native dialogs (no DontUseNativeDialog); skip per-folder icon lookups
+_SAVE_DIALOG_OPTS = QFileDialog.Option.DontUseCustomDirectoryIcons
+_OPEN_DIALOG_OPTS = _SAVE_DIALOG_OPTS | QFileDialog.Option.ReadOnly
+
+@lru_cache(maxsize=4)
+def _task_re(animals: tuple, tasks: tuple) -> re.Pattern:
+    """Compiled session-name pattern, e.g. 20250314-Pici-TS-xxx-3."""
+    return re.compile(
+        rf'20\d{{6}}-({"|".join(map(re.escape, animals))})-({"|".join(map(re.escape, tasks))}).*?-\d{{1,2}}',
+        re.IGNORECASE,
+    )
+
+def _current_task_re() -> re.Pattern:
+    return _task_re(tuple(config.TASK_ANIMALS), tuple(config.TASK_TYPES))
+
+def _match_task(name: str):
+    return _current_task_re().search(name)
+
+def _normalize_events(markers) -> dict:
+    """{event type: frames} with str keys and sorted frames, as stored on disk."""
+    return {str(k): sorted(v) for k, v in markers.items()}
+
+def _dump_events(markers) -> str:
+    return json.dumps(_normalize_events(markers), sort_keys=True)
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _write_atomic(path, data: bytes):
+    """Writes via a sibling temp file so a crash never leaves a half-written file."""
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _parse_events(text: str) -> dict:
+    """Parses an event file; files written before json are python dict literals."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = ast.literal_eval(text)
+    return _normalize_events(data)
+
+def _fmt_hms(ms: int) -> str:
+    """HH:mm:ss for a millisecond position."""
+    m, s = divmod(ms // 1000, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
 class VideoPlayer(QMainWindow):
     """Main application window, coordinates all other components."""
     marker_signal = pyqtSignal(str)
@@ -89,30 +139,50 @@ class VideoPlayer(QMainWindow):
         self.media_player.setVideoOutput(self.video_widget)
         self.markers_widget = MarkersWidget(self)
         self.csv_plot_win = None
-        self.frame_timer = QTimer()
+        self._ui_elapsed = QElapsedTimer()   # time since last ui refresh during playback
+        self._ui_elapsed.start()
+        self._last_pos_sec = -1   # last second / frame shown, skip unchanged label updates
+        self._last_frame_shown = -1
+        self._dur_str = _fmt_hms(0)
+        # slider scrubbing: only the latest target is seeked to
+        self._pending_seek_ms = None
+        self._seek_timer = QTimer()
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(20)
         self.marker_float = None
         if config.MARKER_FLOAT_ENABLED:
             self.marker_float = MarkerFloat(player=self)
         self.config_win = None
 
-        self.is_slider_pressed = False
         self.frame_editing = False
         self.save_status = True
         self.fname = None
+        self._last_saved = None  # (save dir, session name, file written, digest) of the last save
+        self._evt_dir_cache = {}  # evt dir -> (dir mtime, pattern, {session name: event file})
 
         # frame updater
-        self._sorted_marker_events: list[tuple[int, str]] = []
-        self._sorted_marker_frames: list[int] = [] # [frame] ascending, for bisect
+        self._sorted_marker_frames = array('q')   # every marked frame, ascending, for bisect
+        self._sorted_marker_labels: list[str] = [] # marker type per _sorted_marker_frames entry
         self._scan_idx: int = 0
         self._last_frame: int = 0
+        self._frame_index_rev: int = -1   # event_manager.revision the index was built at
+        self._last_marker_name = None      # type shown in marker_label
+        self._last_emitted_marker = None   # (frame, type) last sent to MarkerFloat
+        self._last_frame_label = None   # (frame, revision) the marker label was last computed for
 
         self.init_ui()
         self.connect_signals()
 
         # load settings and last state
         self.settings = QSettings('mel.rnel', 'EventMarkerRefactored')
-        self.resize(self.settings.value("window/size", QSize(1420, 750)))
-        self.move(self.settings.value("window/pos", QPoint(100, 100)))
+        # writes are staged and flushed in one batch, 5 s after the first one or on close
+        self._dirty_settings = {}
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(5000)
+        self._settings_flush_timer.timeout.connect(self.flush_settings)
+        self.resize(self._setting("window/size", QSize(1420, 750)))
+        self.move(self._setting("window/pos", QPoint(100, 100)))
         
         # setup csv plot window if enabled
         self.csv_plot_win = CSVPlotWindow(self)
@@ -128,7 +198,11 @@ class VideoPlayer(QMainWindow):
         
         self._set_float_window_pos()
         
-        app.installEventFilter(self)
+        # key capture only where focus can sit, not an app-wide filter seeing every event
+        for w in (self, self.video_widget, self.markers_widget, self.time_slider, self.play_btn):
+            w.installEventFilter(self)
+        self._capture_keys(self.csv_plot_win)
+        self._capture_keys(self.marker_float)
 
     def init_ui(self):
         main_widget = QWidget()
@@ -262,14 +336,13 @@ class VideoPlayer(QMainWindow):
         self.media_player.playbackStateChanged.connect(self.on_playback_state_changed)
         
         # position/duration signals
-        self.frame_timer.timeout.connect(self.update_position)
         self.media_player.positionChanged.connect(self.update_position)
         self.media_player.durationChanged.connect(self.update_duration)
         
         # slider signals
-        self.time_slider.sliderPressed.connect(self.slider_pressed)
         self.time_slider.sliderReleased.connect(self.slider_released)
-        self.time_slider.sliderMoved.connect(lambda pos: self.media_player.setPosition(int(pos)))
+        self.time_slider.sliderMoved.connect(self.queue_seek)
+        self._seek_timer.timeout.connect(self.flush_seek)
 
         # widget-to-controller signals
         self.markers_widget.jumpToFrame.connect(self.playback_controller.jump_to_frame)
@@ -285,23 +358,35 @@ class VideoPlayer(QMainWindow):
     def on_playback_state_changed(self, state):
         if state == QMediaPlayer.PlaybackState.PlayingState:
             self.play_btn.setText("⏸")
-            self.frame_timer.start(int(1000 / config.PLAYBACK_FPS))
         else:
             self.play_btn.setText("▶")
-            self.frame_timer.stop()
+            # throttled ticks may have been skipped, show where playback stopped
+            self.update_position()
             
     def update_position(self):
+        # positionChanged follows the decoder; cap ui work at ~60 Hz while playing
+        if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            if self._ui_elapsed.elapsed() < 16:
+                return
+            self._ui_elapsed.restart()
+
         if not self.is_slider_pressed:
-            self.time_slider.setValue(self.media_player.position())
+            # no feedback into slider signals from programmatic updates
+            with QSignalBlocker(self.time_slider):
+                self.time_slider.setValue(self.media_player.position())
         
-        pos_ms, dur_ms = self.media_player.position(), self.media_player.duration()
-        current_time = QTime(0, 0, 0).addMSecs(pos_ms).toString("HH:mm:ss")
-        duration = QTime(0, 0, 0).addMSecs(dur_ms).toString("HH:mm:ss")
-        self.time_label.setText(f"{current_time} / {duration}")
+        pos_sec = self.media_player.position() // 1000
+        if pos_sec != self._last_pos_sec:
+            self._last_pos_sec = pos_sec
+            self.time_label.setText(f"{_fmt_hms(pos_sec * 1000)} / {self._dur_str}")
         
         frame = self.playback_controller.get_current_frame()
-        self.frame_label.setText(f"Frame: {frame}")
-        self.update_current_marker_label(frame)
+        if frame != self._last_frame_shown:
+            self._last_frame_shown = frame
+            self.frame_label.setText(f"Frame: {frame}")
+        if not self.is_slider_pressed:
+            # marker label waits for the seek on release
+            self.update_current_marker_label(frame)
 
         # emit MarkerFloat events (not when scrubbing/paused)
         if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState and not self.is_slider_pressed:
@@ -314,17 +399,14 @@ class VideoPlayer(QMainWindow):
 
     def update_duration(self, duration):
         self.time_slider.setRange(0, duration)
+        self._dur_str = _fmt_hms(duration)
+        self._last_pos_sec = self.media_player.position() // 1000
+        self.time_label.setText(f"{_fmt_hms(self._last_pos_sec * 1000)} / {self._dur_str}")
 
     def keyPressEvent(self, event: QKeyEvent):
         self.key_handler.handle_key_press(event)
     
     def eventFilter(self, obj, event):
-        # don't intercept keys when CSV analysis window is active and focused
-        if hasattr(self, 'csv_analysis_win') and self.csv_analysis_win and self.csv_analysis_win.isVisible():
-            focused_widget = QApplication.focusWidget()
-            if focused_widget and focused_widget.window() == self.csv_analysis_win:
-                return False
-        
         if event.type() == QEvent.Type.KeyPress and not self.frame_editing:
             self.keyPressEvent(event)
             return True
@@ -335,19 +417,18 @@ class VideoPlayer(QMainWindow):
         lg.info(f"Recorded Events: {dict(self.event_manager.markers)}")
         self.save_event()
         
-        self.settings.setValue("window/size", self.size())
-        self.settings.setValue("window/pos", self.pos())
-        self.settings.sync()
+        self._stage_setting("window/size", self.size())
+        self._stage_setting("window/pos", self.pos())
         
         # save and close child win
         if self.csv_plot_win and self.csv_plot_win.isVisible():
-            self.settings.setValue("csv_window/pos", self.csv_plot_win.pos())
-            self.settings.setValue("csv_window/size", self.csv_plot_win.size())
+            self._stage_setting("csv_window/pos", self.csv_plot_win.pos())
+            self._stage_setting("csv_window/size", self.csv_plot_win.size())
             self.csv_plot_win.close()
 
         if self.marker_float and self.marker_float.isVisible():
-            self.settings.setValue("marker_float/pos", self.marker_float.pos())
-            self.settings.setValue("marker_float/size", self.marker_float.size())
+            self._stage_setting("marker_float/pos", self.marker_float.pos())
+            self._stage_setting("marker_float/size", self.marker_float.size())
             self.marker_float.close()
         
         if self.csv_plot_win:
@@ -355,21 +436,61 @@ class VideoPlayer(QMainWindow):
         if self.marker_float:
             self.marker_float.close()
 
+        self._settings_flush_timer.stop()
+        self.flush_settings()
+        self.settings.sync()
+
         super().closeEvent(event)
 
-    def slider_pressed(self):
-        self.is_slider_pressed = True
-        
+    def _setting(self, key, default=None, **kwargs):
+        """Reads a setting, seeing staged writes that are not flushed yet."""
+        if key in self._dirty_settings:
+            return self._dirty_settings[key]
+        return self.settings.value(key, default, **kwargs)
+
+    def _stage_setting(self, key, value):
+        self._dirty_settings[key] = value
+        if not self._settings_flush_timer.isActive():
+            self._settings_flush_timer.start()
+
+    def flush_settings(self):
+        for key, value in self._dirty_settings.items():
+            self.settings.setValue(key, value)
+        self._dirty_settings.clear()
+
+    @property
+    def is_slider_pressed(self) -> bool:
+        # the slider tracks this itself, no need to mirror it from press/release
+        return self.time_slider.isSliderDown()
+
     def slider_released(self):
-        self.is_slider_pressed = False
-        target_frame = round(self.time_slider.value() * config.VIDEO_FPS_ORIGINAL / 1000)
-        self.playback_controller.jump_to_frame(target_frame)
+        # drop any pending coarse seek, the exact seek below supersedes it
+        self._seek_timer.stop()
+        self._pending_seek_ms = None
+        # snap to the frame grid so the picture matches get_current_frame()
+        pc = self.playback_controller
+        pc.jump_to_frame(pc.frame_at(self.time_slider.value()))
+
+    def queue_seek(self, pos):
+        # throttle, not debounce: a running timer keeps its deadline so frames
+        # still show during a continuous drag; the latest value wins when it fires
+        self._pending_seek_ms = int(pos)
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def flush_seek(self):
+        if self._pending_seek_ms is not None:
+            # cheap tier while dragging, latest value wins; slider_released does the exact seek
+            self.playback_controller.jump_to_position_ms(self._pending_seek_ms)
+            self._pending_seek_ms = None
 
     # file i/o
 
     def open_file_dialog(self):
-        last_path = self.settings.value('Path/last_vid_path', config.DEFAULT_WORK_PATH)
-        file_name, _ = QFileDialog.getOpenFileName(self, "Select video", last_path, "Video (*.mp4 *.avi *.mkv *.mov)")
+        last_path = self._setting('Path/last_vid_path', config.DEFAULT_WORK_PATH)
+        file_name, _ = QFileDialog.getOpenFileName(
+            self, "Select video", last_path, "Video (*.mp4 *.avi *.mkv *.mov)", options=_OPEN_DIALOG_OPTS
+        )
         if file_name:
             self.load_video(file_name)
 
@@ -381,34 +502,43 @@ class VideoPlayer(QMainWindow):
         self.markers_widget.update()
         self.fname = file_path
         
+        path = Path(file_path)
         self.media_player.setSource(QUrl.fromLocalFile(file_path))
-        self.setWindowTitle(f"{config.WINDOW_TITLE} - {os.path.basename(file_path)}")
+        # prime the decoder so the first real play() doesn't stall on buffering
+        QTimer.singleShot(0, self._prebuffer)
+        self.setWindowTitle(f"{config.WINDOW_TITLE} - {path.name}")
         self.play_btn.setEnabled(True)
-        self.settings.setValue('Path/last_vid_path', os.path.dirname(file_path))
+        self._stage_setting('Path/last_vid_path', str(path.parent))
 
-        self._rebuild_marker_scan()
+        self._rebuild_marker_index()
 
         if config.AUTO_SEARCH_EVENTS:
             self.load_events_silent()
 
+    def _prebuffer(self):
+        self.media_player.play()
+        self.media_player.pause()
+        self.media_player.setPosition(0)
+
     def load_events(self):
         """manually load events file"""
-        last_path = self.settings.value('Path/evt_dir', os.path.dirname(self.fname) if self.fname else config.DEFAULT_WORK_PATH)
-        file_name, _ = QFileDialog.getOpenFileName(self, "Select event file", last_path, "Text file (*.txt)")
+        last_path = self._setting('Path/evt_dir', os.path.dirname(self.fname) if self.fname else config.DEFAULT_WORK_PATH)
+        file_name, _ = QFileDialog.getOpenFileName(
+            self, "Select event file", last_path, "Text file (*.txt)", options=_OPEN_DIALOG_OPTS
+        )
         if not file_name:
             return
         self._read_event_file(file_name)
         # update evt_dir when user manually opens an event file
-        self.settings.setValue('Path/evt_dir', os.path.dirname(file_name))
+        self._stage_setting('Path/evt_dir', os.path.dirname(file_name))
 
     def _read_event_file(self, file_name: str):
         try:
             with open(file_name, 'r') as f:
-                data = ast.literal_eval(f.read())
-                self.event_manager.clear()
-                self.event_manager.markers.update({k: sorted(v) for k, v in data.items()})
+                data = _parse_events(f.read())
+                self.event_manager.load(data)
                 self.markers_widget.update()
-                self._rebuild_marker_scan()
+                self._rebuild_marker_index()
                 self.save_status = True
                 lg.info(f"Loaded events from {file_name}")
         except Exception as e:
@@ -420,22 +550,45 @@ class VideoPlayer(QMainWindow):
             return
         
         # use evt_dir for auto-loading
-        last_path = self.settings.value('Path/evt_dir', None)
+        last_path = self._setting('Path/evt_dir', None)
         if not last_path or not os.path.exists(last_path):
             return
             
-        txts = glob.glob(os.path.join(last_path, 'event-*.txt'))
-        m = re.search(r'2025\d{4}-(Pici|Fusillo)-(TS|BBT|Brinkman|Pull).*?-\d{1,2}', self.fname, re.IGNORECASE)
+        m = _match_task(self.fname)
         if not m:
             return
         vid_base = m.group()
         lg.debug(f'Matched task format {vid_base}')
         
-        for f in txts:
-            if vid_base in os.path.basename(f):
-                lg.info(f'Auto load event {f}')
-                self._read_event_file(f)
-                return
+        f = self._event_file_index(last_path).get(vid_base)
+        if f:
+            lg.info(f'Auto load event {f}')
+            self._read_event_file(f)
+
+    def _event_file_index(self, evt_dir: str) -> dict:
+        """Maps session names to event files in evt_dir, rescanned only when the dir changes."""
+        pattern = _current_task_re()
+        index = {}
+        try:
+            mtime = os.stat(evt_dir).st_mtime
+            cached = self._evt_dir_cache.get(evt_dir)
+            if cached and cached[0] == mtime and cached[1] is pattern:
+                return cached[2]
+
+            with os.scandir(evt_dir) as it:
+                for entry in it:
+                    if not (entry.name.startswith('event-') and entry.name.endswith('.txt')):
+                        continue
+                    m = pattern.search(entry.name)
+                    if m:
+                        index.setdefault(m.group(), entry.path)
+        except OSError as e:
+            # unreachable share, no permission, dir gone: nothing to auto-load, retry next time
+            lg.debug(f'Cannot scan event dir {evt_dir}: {e}')
+            self._evt_dir_cache.pop(evt_dir, None)
+            return {}
+        self._evt_dir_cache[evt_dir] = (mtime, pattern, index)
+        return index
 
     def save_event(self):
         if not any(self.event_manager.markers.values()):
@@ -452,41 +605,57 @@ class VideoPlayer(QMainWindow):
             return
 
         try:
-            m = re.search(r'2025\d{4}-(Pici|Fusillo)-(TS|BBT|Brinkman|Pull).*?-\d{1,2}', self.fname, re.IGNORECASE)
-            fnm = m.group() if m else os.path.splitext(os.path.basename(self.fname))[0]
+            new_bytes = _dump_events(self.event_manager.markers).encode('utf-8')
+            new_hash = _digest(new_bytes)
+
+            m = _match_task(self.fname)
+            fnm = m.group() if m else Path(self.fname).stem
 
             # use evt_save_path for saving
-            base_path = self.settings.value(
+            base_path = Path(self._setting(
                 'Path/evt_save_path',
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Marked Events'),
+                str(Path(__file__).resolve().parent / 'Marked Events'),
                 type=str
-            )
-            os.makedirs(base_path, exist_ok=True)
+            ))
+            base_path.mkdir(parents=True, exist_ok=True)
+
+            # same target and content as the last save, and the file is still there
+            last = self._last_saved
+            if last and last[:2] == (base_path, fnm) and last[3] == new_hash and last[2].is_file():
+                lg.debug(f'Events unchanged since last save to {last[2]}')
+                self.save_status = True
+                self.event_manager.undo_stack.clear()
+                self.event_manager.redo_stack.clear()
+                return
 
-            file_path = os.path.join(base_path, f'event-{fnm}')
-            
             # check if file exists with same content
-            while os.path.exists(file_path+'.txt'):
+            stem = f'event-{fnm}'
+            while True:
+                file_path = base_path / f'{stem}.txt'
                 try:
-                    with open(file_path+'.txt', 'r') as f:
-                        existing_data = ast.literal_eval(f.read())
-                    if existing_data == dict(self.event_manager.markers):
-                        lg.debug(f'Events unchanged, not saving to {file_path}')
-                        self.save_status = True
-                        self.event_manager.undo_stack.clear()
-                        self.event_manager.redo_stack.clear()
-                        return
-                    else:
-                        file_path += '(new)'
-                except:
+                    with open(file_path, 'rb') as f:
+                        existing = f.read()
+                    # same bytes is the common case; older dict-literal files need a parse
+                    unchanged = (_digest(existing) == new_hash
+                                 or _parse_events(existing.decode('utf-8')) == _normalize_events(self.event_manager.markers))
+                except FileNotFoundError:
+                    break
+                except Exception:
                     break  # if can't read, just overwrite
-            
-            file_path += '.txt'
+                if unchanged:
+                    lg.debug(f'Events unchanged, not saving to {file_path}')
+                    self._last_saved = (base_path, fnm, file_path, new_hash)
+                    self.save_status = True
+                    self.event_manager.undo_stack.clear()
+                    self.event_manager.redo_stack.clear()
+                    return
+                stem += '(new)'
+
             # save the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(str(dict(self.event_manager.markers)))
+            _write_atomic(file_path, new_bytes)
 
             lg.info(f'Successfully saved events to {file_path}')
+            self._last_saved = (base_path, fnm, file_path, new_hash)
             self.save_status = True
             self.event_manager.undo_stack.clear()
             self.event_manager.redo_stack.clear()
@@ -496,13 +665,15 @@ class VideoPlayer(QMainWindow):
             lg.error(f"Recorded Events: {dict(self.event_manager.markers)}")
 
         try:
-            # open file in system viewer
+            # open file in system viewer without waiting on it; only needed here, so imported here
+            import platform
+            import subprocess
             if platform.system() == 'Windows':
                 os.startfile(file_path)
             elif platform.system() == 'Darwin':
-                subprocess.call(['open', file_path])
+                subprocess.Popen(['open', file_path])
             else:
-                subprocess.call(['xdg-open', file_path])
+                subprocess.Popen(['xdg-open', file_path])
         except OSError as e:
             lg.warning(f'Failed to open saved event txt: {e}')        
 
@@ -516,25 +687,24 @@ class VideoPlayer(QMainWindow):
             return
 
         # default filename
-        base_name = os.path.splitext(os.path.basename(self.fname))[0]
-        default_name = f'event-{base_name}.txt'
+        video = Path(self.fname)
+        default_name = f'event-{video.stem}.txt'
 
-        last_save_path = self.settings.value('Path/evt_save_path', os.path.dirname(self.fname))
-        default_path = os.path.join(last_save_path, default_name)
+        last_save_path = self._setting('Path/evt_save_path', str(video.parent))
+        default_path = str(Path(last_save_path) / default_name)
 
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Events As", default_path, "Text Files (*.txt);;All Files (*)"
+            self, "Save Events As", default_path, "Text Files (*.txt);;All Files (*)", options=_SAVE_DIALOG_OPTS
         )
 
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(str(dict(self.event_manager.markers)))
+                _write_atomic(file_path, _dump_events(self.event_manager.markers).encode('utf-8'))
 
                 lg.info(f'Successfully saved events to {file_path}')
                 
                 # update evt_save_path when user saves to a new location
-                self.settings.setValue('Path/evt_save_path', os.path.dirname(file_path))
+                self._stage_setting('Path/evt_save_path', os.path.dirname(file_path))
                 self.save_status = True
 
             except Exception as e:
@@ -569,24 +739,44 @@ class VideoPlayer(QMainWindow):
             self.setFocus()
             
     def update_current_marker_label(self, frame):
-        name = None
-        for key, frames in self.event_manager.markers.items():
-            if frame in frames:
-                name = key
-                break
-        txt = f"Marker: {name}" if name else "Marker: –"
-        if self.marker_label.text() != txt:
-            self.marker_label.setText(txt)
-        if name and self.marker_float:
-            self.marker_signal.emit(str(name))
+        # same frame and no edits since last call: nothing can have changed
+        key = (frame, self.event_manager.revision)
+        if key == self._last_frame_label:
+            return
+        self._last_frame_label = key
+        if self._frame_index_rev != self.event_manager.revision:
+            self._rebuild_marker_index()
+        frames = self._sorted_marker_frames
+        i = bisect_left(frames, frame)
+        name = self._sorted_marker_labels[i] if i < len(frames) and frames[i] == frame else None
+        if name != self._last_marker_name:
+            self._last_marker_name = name
+            self.marker_label.setText(f"Marker: {name}" if name else "Marker: –")
+        # only on reaching a new marker frame, even of the same type;
+        # MarkerFloat clears itself after its interval
+        marker = (frame, name) if name else None
+        if marker != self._last_emitted_marker:
+            self._last_emitted_marker = marker
+            if marker and self.marker_float:
+                self.marker_signal.emit(str(name))
 
     # workspace menu handlers
     
+    def _capture_keys(self, win):
+        """Routes key presses in a tool window, including its focusable children, to the key handler."""
+        if win is None:
+            return
+        win.installEventFilter(self)
+        for child in win.findChildren(QWidget):
+            if child.focusPolicy() != Qt.FocusPolicy.NoFocus:
+                child.installEventFilter(self)
+
     def toggle_marker_float(self, checked):
         if checked:
             if not self.marker_float:
                 self.marker_float = MarkerFloat(player=self)
                 self.marker_signal.connect(self.marker_float.receive_string)
+                self._capture_keys(self.marker_float)
             self.marker_float.show()
         else:
             if self.marker_float:
@@ -596,6 +786,7 @@ class VideoPlayer(QMainWindow):
         if checked:
             if not self.csv_plot_win:
                 self.csv_plot_win = CSVPlotWindow(self)
+                self._capture_keys(self.csv_plot_win)
             self.csv_plot_win.show()
         else:
             if self.csv_plot_win:
@@ -604,18 +795,21 @@ class VideoPlayer(QMainWindow):
     
     def _set_float_window_pos(self):
         if self.csv_plot_win and self.csv_plot_win.isVisible():
-            csv_pos = self.settings.value("csv_window/pos", QPoint(self.x() + 20, self.y() + self.height() - 170))
-            csv_size = self.settings.value("csv_window/size", self.csv_plot_win.size())
+            csv_pos = self._setting("csv_window/pos", QPoint(self.x() + 20, self.y() + self.height() - 170))
+            csv_size = self._setting("csv_window/size", self.csv_plot_win.size())
             self.csv_plot_win.move(csv_pos)
             self.csv_plot_win.resize(csv_size)
         if self.marker_float and self.marker_float.isVisible():
-            marker_pos = self.settings.value("marker_float/pos", QPoint(self.x() - 50, self.y() + 50))
-            marker_size = self.settings.value("marker_float/size", self.marker_float.size())
+            marker_pos = self._setting("marker_float/pos", QPoint(self.x() - 50, self.y() + 50))
+            marker_size = self._setting("marker_float/size", self.marker_float.size())
             self.marker_float.move(marker_pos)
             self.marker_float.resize(marker_size)
 
     def open_config_window(self):
         """Opens the modal configuration dialog."""
+        # imported on first use, the settings dialog is rarely opened
+        from evtmkr.cfg_window import ConfigWindow
+
         if not self.config_win:
             self.config_win = ConfigWindow(self)
         
@@ -635,6 +829,8 @@ class VideoPlayer(QMainWindow):
     def open_csv_analysis(self):
         """opens the CSV analysis window"""
         if not hasattr(self, 'csv_analysis_win') or self.csv_analysis_win is None:
+            # pulls in pandas/scipy/pyplot, so only imported on demand
+            from evtmkr.csv_analysis_window import CSVAnalysisWindow
             self.csv_analysis_win = CSVAnalysisWindow(self)
         self.csv_analysis_win.show()
         self.csv_analysis_win.raise_()
@@ -651,27 +847,31 @@ class VideoPlayer(QMainWindow):
         self.csv_plot_action.setChecked(config.CSV_PLOT_ENABLED)
         self.toggle_csv_plot(config.CSV_PLOT_ENABLED)
 
-    def _rebuild_marker_scan(self):
-        items: list[tuple[int, str]] = []
-        for name, frames in self.event_manager.markers.items():
-            for f in frames:
-                items.append((int(f), str(name)))
-        items.sort(key=lambda t: t[0])
-        self._sorted_marker_events = items
-        self._sorted_marker_frames = [f for f, _ in items]
+    def _rebuild_marker_index(self):
+        # one flat sorted index serves both the marker label bisect and the crossing scan;
+        # sort is stable, so the first marker type wins when several share a frame
+        pairs = sorted(
+            ((int(f), str(name)) for name, frames in self.event_manager.markers.items() for f in frames),
+            key=lambda t: t[0]
+        )
+        self._sorted_marker_frames = array('q', (f for f, _ in pairs))
+        self._sorted_marker_labels = [name for _, name in pairs]
+        self._frame_index_rev = self.event_manager.revision
         cur = self.playback_controller.get_current_frame()
         self._scan_idx = bisect_right(self._sorted_marker_frames, cur)  # first > cur
         self._last_frame = cur
 
     def consume_passed_markers(self, current_frame: int):
+        if self._frame_index_rev != self.event_manager.revision:
+            self._rebuild_marker_index()  # edited while playing; resumes after the current frame
         # backward seek: just reposition pointer, no emit
         if current_frame < self._last_frame:
             self._scan_idx = bisect_right(self._sorted_marker_frames, current_frame)
             self._last_frame = current_frame
             return
         # forward: emit every marker crossed since last frame
-        while self._scan_idx < len(self._sorted_marker_events) and self._sorted_marker_events[self._scan_idx][0] <= current_frame:
-            _, name = self._sorted_marker_events[self._scan_idx]
+        while self._scan_idx < len(self._sorted_marker_frames) and self._sorted_marker_frames[self._scan_idx] <= current_frame:
+            name = self._sorted_marker_labels[self._scan_idx]
             if self.marker_float:           # MarkerFloat wired via self.marker_signal
                 self.marker_signal.emit(name)
             self._scan_idx += 1
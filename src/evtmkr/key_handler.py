@@ -145,11 +145,7 @@ class KeyHandler:
         current_frame = self.playback.get_current_frame()
 
         # find which marker type is at the current frame
-        target_mtype = None
-        for mtype, frames in self.events.markers.items():
-            if current_frame in frames:
-                target_mtype = mtype
-                break
+        target_mtype = self.events.marker_type_at(current_frame)
         
         if not target_mtype:
             return False  # no marker to nudge
@@ -170,28 +166,8 @@ class KeyHandler:
         if new_frame == current_frame:
             return False  # no change occurred
 
-        # update the frame, sort the list, and log the action for undo
-        frames[index] = new_frame
-        frames.sort()
-        
-        # update all matching entries in undo stack
-        for uidx, action_tuple in enumerate(self.events.undo_stack):
-            if len(action_tuple) == 3:  # add/remove actions
-                action, etype, uframe = action_tuple
-                if etype == target_mtype and uframe == current_frame:
-                    self.events.undo_stack[uidx] = (action, etype, new_frame)
-            elif len(action_tuple) == 4:  # move actions
-                action, etype, old_frame, uframe = action_tuple
-                if etype == target_mtype and uframe == current_frame:
-                    self.events.undo_stack[uidx] = (action, etype, old_frame, new_frame)
-        
-        # add new move action
-        self.events.undo_stack.append(('move', target_mtype, current_frame, new_frame))
-        self.events.redo_stack.clear()
-        
-        print(f"Nudged marker {target_mtype} from {current_frame} to {new_frame}")
-        return True
-    
+        return self.events.move_marker(target_mtype, current_frame, new_frame)
+
     def _get_shots_dir(self) -> Path:
         sd = Path(__file__).parent / 'shots'
         sd.mkdir(exist_ok=True)
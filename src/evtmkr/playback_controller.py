@@ -24,6 +24,11 @@ class PlaybackController:
         final_pos = position_ms - self.compensation if position_ms > 0 else 0
         self.media_player.setPosition(int(final_pos))
 
+    def jump_to_position_ms(self, ms: int):
+        """Cheap scrubbing tier: raw position, no frame snapping or
+        compensation. jump_to_frame is the exact tier used on release."""
+        self.media_player.setPosition(max(0, int(ms)))
+
     def change_playback_rate(self, factor):
         if factor == -1:  # reset
             new_rate = 1.0
@@ -32,6 +37,9 @@ class PlaybackController:
         self.media_player.setPlaybackRate(new_rate)
         return new_rate
 
+    def frame_at(self, ms: int) -> int:
+        """Frame shown at player position ms, compensation included."""
+        return round((ms + self.compensation) * config.VIDEO_FPS_ORIGINAL / 1000)
+
     def get_current_frame(self) -> int:
-        pos = self.media_player.position() + self.compensation
-        return round(pos * config.VIDEO_FPS_ORIGINAL / 1000)
\ No newline at end of file
+        return self.frame_at(self.media_player.position())
\ No newline at end of file
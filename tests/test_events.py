@@ -0,0 +1,90 @@
+"""
+Tests for event file i/o and EventManager bookkeeping; no video needed.
+"""
+import pytest
+
+from evtmkr.event_manager import EventManager
+from evtmkr.gui import _dump_events, _parse_events, _write_atomic
+
+
+class TestEventFiles:
+    """Event file format: json, with dict-literal files from older versions."""
+
+    def test_parse_json(self):
+        assert _parse_events('{"1": [30, 10], "2": [5]}') == {'1': [10, 30], '2': [5]}
+
+    def test_parse_legacy_dict_literal(self):
+        # written by str(dict(markers)) before the json format
+        text = "{'1': [30, 10], 2: [5]}"
+        assert _parse_events(text) == {'1': [10, 30], '2': [5]}
+
+    def test_parse_invalid(self):
+        with pytest.raises((ValueError, SyntaxError)):
+            _parse_events('not an event file')
+
+    def test_save_read_round_trip(self, tmp_path):
+        markers = {'1': [120, 3], '2': [], 'z': [7]}
+        path = tmp_path / 'event-test.txt'
+        _write_atomic(path, _dump_events(markers).encode('utf-8'))
+
+        assert not (tmp_path / 'event-test.txt.tmp').exists()
+        assert _parse_events(path.read_text(encoding='utf-8')) == {'1': [3, 120], '2': [], 'z': [7]}
+
+    def test_dump_is_stable(self):
+        # same markers in any order give the same bytes, so saves can be compared by digest
+        assert _dump_events({'2': [5], '1': [30, 10]}) == _dump_events({'1': [10, 30], '2': [5]})
+
+
+class TestEventManager:
+    """Marker lookups stay correct across edits and history."""
+
+    def test_marker_type_at_after_add(self):
+        em = EventManager()
+        assert em.marker_type_at(10) is None
+        assert em.add_marker(1, 10)
+        assert not em.add_marker(1, 10)  # duplicate
+        assert em.marker_type_at(10) == '1'
+
+    def test_marker_type_at_after_undo_redo(self):
+        em = EventManager()
+        em.add_marker('a', 10)
+        em.add_marker('b', 20)
+
+        em.undo()
+        assert em.marker_type_at(20) is None
+        assert em.marker_type_at(10) == 'a'
+
+        em.redo()
+        assert em.marker_type_at(20) == 'b'
+
+        assert em.remove_marker_at_frame(10)
+        assert em.marker_type_at(10) is None
+        em.undo()
+        assert em.marker_type_at(10) == 'a'
+
+    def test_marker_type_at_after_move(self):
+        em = EventManager()
+        em.add_marker('a', 10)
+        rev = em.revision
+
+        assert em.move_marker('a', 10, 12)
+        assert em.revision > rev
+        assert em.marker_type_at(10) is None
+        assert em.marker_type_at(12) == 'a'
+        # history follows the moved marker
+        assert em.undo_stack[0] == ('add', 'a', 12)
+
+        em.undo()
+        assert em.marker_type_at(12) is None
+        assert em.marker_type_at(10) == 'a'
+        em.redo()
+        assert em.marker_type_at(12) == 'a'
+
+    def test_load_replaces_markers(self):
+        em = EventManager()
+        em.add_marker('a', 10)
+        em.load({'b': [30, 20]})
+        assert em.markers['b'] == [20, 30]
+        assert em.marker_type_at(10) is None
+        assert em.marker_type_at(20) == 'b'
+        assert not em.undo_stack